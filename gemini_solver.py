@@ -1,4 +1,6 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 from dotenv import load_dotenv
 
@@ -21,6 +23,19 @@ headers = {
     "x-goog-api-key": GEMINI_API_KEY,
 }
 
+# Reusable keep-alive session with retries on rate limits / transient errors
+session = requests.Session()
+session.headers.update(headers)
+session.mount("https://", HTTPAdapter(
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    ),
+))
+
 # Payload
 payload = {
     "contents": [{
@@ -30,7 +45,7 @@ payload = {
 
 # Send request to Gemini API
 try:
-    response = requests.post(GEMINI_API_URL, headers=headers, json=payload)
+    response = session.post(GEMINI_API_URL, json=payload)
     response.raise_for_status()
     result = response.json()
     solution_text = result['candidates'][0]['content']['parts'][0]['text']